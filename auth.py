@@ -0,0 +1,97 @@
+from fastapi import HTTPException, Depends
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import hashlib
+import hmac
+import time
+from cachetools import TLRUCache
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+import jwt
+from datetime import datetime, timedelta, timezone
+
+# =========================
+# SECURITY
+# =========================
+SECRET_KEY = "jobflow-secret-key-2026-change-in-production"
+JWT_KEY = SECRET_KEY.encode()
+ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_MINUTES = 10080
+security = HTTPBearer()
+PH = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+# verified against when the email is unknown, so a miss costs as much as a hit
+DUMMY_HASH = PH.hash("")
+
+# decoded tokens -> (user_id, exp); an entry lives for at most a minute and
+# never past the token's own expiry. Only touched from the event loop, so
+# no lock is needed.
+TOKEN_CACHE_TTL = 60
+TOKEN_CACHE = TLRUCache(
+    maxsize=10_000,
+    ttu=lambda _token, entry, now: min(now + TOKEN_CACHE_TTL, entry[1]),
+    timer=time.time,
+)
+
+# =========================
+# AUTH HELPERS
+# =========================
+def hash_password(password: str) -> str:
+    return PH.hash(password)
+
+def is_legacy_hash(hashed: str) -> bool:
+    # accounts created before argon2id store an unsalted sha256 hex digest
+    return not hashed.startswith("$argon2")
+
+def verify_password(plain: str, hashed: str) -> bool:
+    if is_legacy_hash(hashed):
+        # pay the argon2 cost anyway so legacy accounts don't answer faster
+        # than unknown emails
+        verify_dummy_password(plain)
+        legacy = hashlib.sha256(plain.encode()).hexdigest()
+        return hmac.compare_digest(legacy, hashed)
+
+    try:
+        return PH.verify(hashed, plain)
+    except (VerificationError, InvalidHashError):
+        return False
+
+def verify_dummy_password(plain: str) -> bool:
+    try:
+        PH.verify(DUMMY_HASH, plain)
+    except (VerificationError, InvalidHashError):
+        pass
+
+    return False
+
+def needs_rehash(hashed: str) -> bool:
+    return is_legacy_hash(hashed) or PH.check_needs_rehash(hashed)
+
+def create_access_token(data: dict):
+    payload = data.copy()
+    payload["exp"] = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    return jwt.encode(payload, JWT_KEY, algorithm=ALGORITHM)
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    token = credentials.credentials
+
+    cached = TOKEN_CACHE.get(token)
+    if cached is not None:
+        return cached[0]
+
+    try:
+        payload = jwt.decode(token, JWT_KEY, algorithms=[ALGORITHM])
+    except jwt.ExpiredSignatureError:
+        raise HTTPException(status_code=401, detail="Token expired")
+    except jwt.InvalidTokenError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    user_id = payload.get("user_id")
+
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    if "exp" in payload:
+        TOKEN_CACHE[token] = (user_id, payload["exp"])
+
+    return user_id
@@ -0,0 +1,113 @@
+import os
+from fastapi import Request
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+# =========================
+# CACHE
+# =========================
+# optional: without REDIS_URL every read goes straight to Postgres
+REDIS_URL = os.getenv("REDIS_URL")
+
+JOBS_CACHE_TTL = 30
+
+# keep a hung Redis from stalling requests: past this the call raises and the
+# cache is skipped
+REDIS_TIMEOUT = 0.1
+
+def create_redis() -> aioredis.Redis | None:
+    if not REDIS_URL:
+        return None
+
+    return aioredis.from_url(
+        REDIS_URL,
+        socket_timeout=REDIS_TIMEOUT,
+        socket_connect_timeout=REDIS_TIMEOUT,
+    )
+
+def get_redis(request: Request) -> aioredis.Redis | None:
+    return request.app.state.redis
+
+def jobs_cache_key(user_id: int) -> str:
+    return f"jobs:{user_id}"
+
+# bumped by every write to the user's jobs; a read only caches its result if
+# the generation it saw before querying Postgres is still current
+def jobs_generation_key(user_id: int) -> str:
+    return f"jobs:gen:{user_id}"
+
+# outlives any cache entry by far, so an expired generation can't be confused
+# with one a concurrent read saw
+JOBS_GENERATION_TTL = 24 * 60 * 60
+
+# KEYS: entry, generation; ARGV: generation seen by the read, entry, ttl
+SET_IF_GENERATION_LUA = """
+if (redis.call('GET', KEYS[2]) or '') == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+end
+"""
+
+# The cache only ever saves work, so a Redis outage degrades to a miss rather
+# than failing the request.
+#
+# Returns (entry, generation): entry is (etag, body) or None on a miss, and
+# generation goes back to set_cached_jobs. It is None when Redis is
+# unavailable, which skips the write.
+async def get_cached_jobs(redis: aioredis.Redis | None, user_id: int):
+    if redis is None:
+        return None, None
+
+    try:
+        raw, generation = await redis.mget(
+            jobs_cache_key(user_id), jobs_generation_key(user_id)
+        )
+    except RedisError:
+        return None, None
+
+    generation = generation or b""
+
+    if not raw:
+        return None, generation
+
+    # stored as b'<etag>\n<json body>'; compact JSON never contains a newline
+    etag, body = raw.split(b"\n", 1)
+    return (etag.decode(), body), generation
+
+async def set_cached_jobs(
+    redis: aioredis.Redis | None,
+    user_id: int,
+    generation: bytes | None,
+    etag: str,
+    body: bytes,
+):
+    if redis is None or generation is None:
+        return
+
+    # compare-and-set: a write that committed (and invalidated) while this
+    # read was in Postgres has moved the generation, so the stale body is
+    # dropped instead of cached
+    try:
+        await redis.eval(
+            SET_IF_GENERATION_LUA,
+            2,
+            jobs_cache_key(user_id),
+            jobs_generation_key(user_id),
+            generation,
+            etag.encode() + b"\n" + body,
+            JOBS_CACHE_TTL,
+        )
+    except RedisError:
+        pass
+
+async def invalidate_jobs(redis: aioredis.Redis | None, user_id: int):
+    if redis is None:
+        return
+
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.delete(jobs_cache_key(user_id))
+            pipe.incr(jobs_generation_key(user_id))
+            pipe.expire(jobs_generation_key(user_id), JOBS_GENERATION_TTL)
+            await pipe.execute()
+    except RedisError:
+        pass
@@ -0,0 +1,101 @@
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
+import asyncpg
+from pydantic import BaseModel, Field
+
+from auth import (
+    create_access_token,
+    hash_password,
+    needs_rehash,
+    verify_dummy_password,
+    verify_password,
+)
+from db import get_pool
+
+router = APIRouter()
+
+# =========================
+# MODELS
+# =========================
+# widths match users.username / users.email
+class UserSignup(BaseModel):
+    username: str = Field(max_length=100)
+    email: str = Field(max_length=100)
+    password: str
+
+class UserLogin(BaseModel):
+    email: str
+    password: str
+
+# =========================
+# ROUTES
+# =========================
+@router.post("/signup")
+async def signup(user: UserSignup, pool: asyncpg.Pool = Depends(get_pool)):
+    # argon2 is deliberately slow; keep it off the event loop
+    hashed = await run_in_threadpool(hash_password, user.password)
+
+    # ON CONFLICT without a target covers both the username and email UNIQUE
+    # constraints, so a duplicate comes back as no row instead of an error
+    async with pool.acquire() as conn:
+        user_id = await conn.fetchval(
+            """
+            INSERT INTO users (username, email, password_hash) VALUES ($1,$2,$3)
+            ON CONFLICT DO NOTHING
+            RETURNING id
+            """,
+            user.username, user.email, hashed
+        )
+
+    if user_id is None:
+        raise HTTPException(status_code=400, detail="User already exists")
+
+    token = create_access_token({"user_id": user_id})
+
+    return {
+        "token": token,
+        "user": {
+            "id": user_id,
+            "username": user.username,
+            "email": user.email
+        }
+    }
+
+@router.post("/login")
+async def login(user: UserLogin, pool: asyncpg.Pool = Depends(get_pool)):
+    async with pool.acquire() as conn:
+        db_user = await conn.fetchrow(
+            "SELECT id, username, email, password_hash FROM users WHERE email=$1",
+            user.email
+        )
+
+    # unknown emails still run argon2 so response time doesn't reveal which
+    # addresses have accounts
+    if not db_user:
+        await run_in_threadpool(verify_dummy_password, user.password)
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+
+    if not await run_in_threadpool(
+        verify_password, user.password, db_user["password_hash"]
+    ):
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+
+    # upgrade sha256 (or outdated argon2) hashes now that we have the password
+    if needs_rehash(db_user["password_hash"]):
+        hashed = await run_in_threadpool(hash_password, user.password)
+        async with pool.acquire() as conn:
+            await conn.execute(
+                "UPDATE users SET password_hash=$1 WHERE id=$2",
+                hashed, db_user["id"]
+            )
+
+    token = create_access_token({"user_id": db_user["id"]})
+
+    return {
+        "token": token,
+        "user": {
+            "id": db_user["id"],
+            "username": db_user["username"],
+            "email": db_user["email"]
+        }
+    }
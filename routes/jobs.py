@@ -0,0 +1,205 @@
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from typing import Annotated
+import asyncpg
+import orjson
+from datetime import date
+from pydantic import BaseModel, Field
+from redis import asyncio as aioredis
+
+from auth import get_current_user
+from cache import get_cached_jobs, get_redis, invalidate_jobs, set_cached_jobs
+from db import get_pool
+
+router = APIRouter()
+
+# =========================
+# MODELS
+# =========================
+# max lengths mirror the VARCHAR columns so oversize input is a 422, not a
+# database error
+class Job(BaseModel):
+    company: str = Field(max_length=100)
+    role: str = Field(max_length=100)
+    status: str = Field(max_length=50)
+    applied_date: date
+
+# OpenAPI documentation only: get_jobs returns orjson-encoded bytes directly,
+# so this model never validates or serializes anything. Fields are nullable
+# to describe the columns honestly.
+class JobOut(BaseModel):
+    id: int
+    company: str | None
+    role: str | None
+    status: str | None
+    applied_date: date | None
+
+# =========================
+# ROUTES
+# =========================
+# column order of the GET /jobs SELECT; rows are zipped against it
+JOB_COLUMNS = ("id", "company", "role", "status", "applied_date")
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    # If-None-Match uses weak comparison, so W/"x" matches "x"
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+def jobs_response(request: Request, etag: str, body: bytes | None = None) -> Response:
+    # the token, not the URL, picks the user, so browsers must revalidate
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if body is None or etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@router.get("/jobs", response_model=list[JobOut])
+async def get_jobs(
+    request: Request,
+    user_id: int = Depends(get_current_user),
+    pool: asyncpg.Pool = Depends(get_pool),
+    redis: aioredis.Redis | None = Depends(get_redis)
+):
+    cached, generation = await get_cached_jobs(redis, user_id)
+    if cached is not None:
+        etag, body = cached
+        return jobs_response(request, etag, body)
+
+    async with pool.acquire() as conn:
+        # one snapshot for both queries, so the ETag always describes the
+        # body it is cached with; read-only and transaction-scoped, so fine
+        # behind PgBouncer
+        async with conn.transaction(isolation="repeatable_read", readonly=True):
+            # xmin changes on every insert/update of a row and ids vanish on
+            # delete, so this fingerprint moves whenever the user's list does
+            fingerprint = await conn.fetchval(
+                """
+                SELECT md5(COALESCE(string_agg(id::text || ':' || xmin::text, ',' ORDER BY id), ''))
+                FROM jobs
+                WHERE user_id=$1
+                """,
+                user_id
+            )
+            # weak: GZipMiddleware may encode the same body differently
+            etag = f'W/"{user_id}-{fingerprint}"'
+
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return jobs_response(request, etag)
+
+            rows = await conn.fetch(
+                """
+                SELECT id, company, role, status, applied_date
+                FROM jobs
+                WHERE user_id=$1
+                ORDER BY applied_date DESC
+                """,
+                user_id
+            )
+
+    # the bytes are cached as-is, so encode once here instead of leaving it to
+    # response_model; orjson writes dates as ISO strings, same as pydantic
+    body = orjson.dumps([dict(zip(JOB_COLUMNS, row)) for row in rows])
+    await set_cached_jobs(redis, user_id, generation, etag, body)
+    return jobs_response(request, etag, body)
+
+@router.post("/jobs")
+async def add_job(
+    job: Job,
+    user_id: int = Depends(get_current_user),
+    pool: asyncpg.Pool = Depends(get_pool),
+    redis: aioredis.Redis | None = Depends(get_redis)
+):
+    async with pool.acquire() as conn:
+        await conn.execute(
+            """
+            INSERT INTO jobs (company, role, status, applied_date, user_id)
+            VALUES ($1,$2,$3,$4,$5)
+            """,
+            job.company, job.role, job.status, job.applied_date, user_id
+        )
+
+    await invalidate_jobs(redis, user_id)
+    return {"message": "Job added"}
+
+# above this many rows COPY beats a pipelined multi-row INSERT
+BULK_COPY_THRESHOLD = 1000
+BULK_MAX_JOBS = 10_000
+
+@router.post("/jobs/bulk")
+async def add_jobs_bulk(
+    jobs: Annotated[list[Job], Field(min_length=1, max_length=BULK_MAX_JOBS)],
+    user_id: int = Depends(get_current_user),
+    pool: asyncpg.Pool = Depends(get_pool),
+    redis: aioredis.Redis | None = Depends(get_redis)
+):
+    records = [
+        (job.company, job.role, job.status, job.applied_date, user_id)
+        for job in jobs
+    ]
+
+    async with pool.acquire() as conn:
+        if len(records) > BULK_COPY_THRESHOLD:
+            await conn.copy_records_to_table(
+                "jobs",
+                records=records,
+                columns=["company", "role", "status", "applied_date", "user_id"]
+            )
+        else:
+            await conn.executemany(
+                """
+                INSERT INTO jobs (company, role, status, applied_date, user_id)
+                VALUES ($1,$2,$3,$4,$5)
+                """,
+                records
+            )
+
+    await invalidate_jobs(redis, user_id)
+    return {"message": "Jobs added", "count": len(records)}
+
+@router.put("/jobs/{job_id}")
+async def update_job(
+    job_id: int,
+    job: Job,
+    user_id: int = Depends(get_current_user),
+    pool: asyncpg.Pool = Depends(get_pool),
+    redis: aioredis.Redis | None = Depends(get_redis)
+):
+    async with pool.acquire() as conn:
+        updated = await conn.fetchval(
+            """
+            UPDATE jobs
+            SET company=$1, role=$2, status=$3, applied_date=$4
+            WHERE id=$5 AND user_id=$6
+            RETURNING id
+            """,
+            job.company, job.role, job.status, job.applied_date, job_id, user_id
+        )
+
+    # no row means the job doesn't exist or belongs to someone else
+    if updated is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    await invalidate_jobs(redis, user_id)
+    return {"message": "Updated"}
+
+@router.delete("/jobs/{job_id}")
+async def delete_job(
+    job_id: int,
+    user_id: int = Depends(get_current_user),
+    pool: asyncpg.Pool = Depends(get_pool),
+    redis: aioredis.Redis | None = Depends(get_redis)
+):
+    async with pool.acquire() as conn:
+        deleted = await conn.fetchval(
+            "DELETE FROM jobs WHERE id=$1 AND user_id=$2 RETURNING id",
+            job_id, user_id
+        )
+
+    if deleted is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    await invalidate_jobs(redis, user_id)
+    return {"message": "Deleted"}